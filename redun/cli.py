@@ -87,7 +87,13 @@ from redun.tags import (
     parse_tag_key_value,
 )
 from redun.task import Task as BaseTask
-from redun.utils import add_import_path, format_table, pickle_dump, trim_string
+from redun.utils import (
+    PICKLE_TRANSPORT_PROTOCOL,
+    add_import_path,
+    format_table,
+    pickle_dump,
+    trim_string,
+)
 from redun.value import NoneType, get_type_registry
 
 # Constants.
@@ -2551,7 +2557,7 @@ class RedunClient:
                 # Write result output.
                 output_file = BaseFile(output_path)
                 with output_file.open("wb") as out:
-                    pickle_dump(result, out)
+                    pickle_dump(result, out, protocol=PICKLE_TRANSPORT_PROTOCOL)
             else:
                 self.display(result)
 
@@ -2561,8 +2567,21 @@ class RedunClient:
             if args.error:
                 # Write error and traceback.
                 error_traceback = Traceback.from_error(error)
-                with BaseFile(args.error).open("wb") as out:
-                    pickle_dump((error, error_traceback), out)
+                error_file = BaseFile(args.error)
+                try:
+                    with error_file.open("wb") as out:
+                        pickle_dump(
+                            (error, error_traceback), out, protocol=PICKLE_TRANSPORT_PROTOCOL
+                        )
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # Some errors cannot be serialized so record them as generic Exceptions.
+                    error2 = Exception(repr(error))
+                    with error_file.open("wb") as out:
+                        pickle_dump(
+                            (error2, Traceback(error2, error_traceback.frames)),
+                            out,
+                            protocol=PICKLE_TRANSPORT_PROTOCOL,
+                        )
 
             raise error
 
@@ -26,7 +26,7 @@ from redun.job_array import AWS_ARRAY_VAR, JobArrayer
 from redun.scheduler import Job, Scheduler, Traceback
 from redun.scripting import ScriptError, get_task_command
 from redun.task import Task
-from redun.utils import get_import_paths, pickle_dump
+from redun.utils import PICKLE_TRANSPORT_PROTOCOL, get_import_paths, pickle_dump
 
 SUBMITTED = "SUBMITTED"
 PENDING = "PENDING"
@@ -50,15 +50,19 @@ BATCH_JOB_STATUSES = aws_utils.JobStatus(
 
 BATCH_LOG_GROUP = "/aws/batch/job"
 ARRAY_JOB_SUFFIX = "array"
+DEFAULT_JOB_NAME_PREFIX = "batch-job"
 DOCKER_INSPECT_ERROR = "CannotInspectContainerError: Could not transition to inspecting"
 BATCH_JOB_TIMEOUT_ERROR = "Job attempt duration exceeded timeout"
+JOB_NAME_HASH_PATTERN = re.compile(".*-(?P<hash>[^-]+)")
+# The AWS Batch API can only describe up to 100 jobs at a time.
+MAX_DESCRIBE_JOBS = 100
 
 
 def get_default_registry() -> str:
     """
     Returns the default ECR registry.
     """
-    client = boto3.client("ecr")
+    client = aws_utils.get_aws_client("ecr", aws_region=None)
     resp = client.get_authorization_token()
     registry = resp["authorizationData"][0]["proxyEndpoint"].strip("https://")
     return registry
@@ -68,7 +72,7 @@ def get_or_create_repo(repo_name: str) -> dict:
     """
     Get or create an ECR repository.
     """
-    client = boto3.client("ecr")
+    client = aws_utils.get_aws_client("ecr", aws_region=None)
 
     resp = client.describe_repositories(repositoryNames=[repo_name])
     if resp["repositories"]:
@@ -172,9 +176,13 @@ def get_or_create_job_definition(
     return job_def
 
 
+@lru_cache(maxsize=200)
 def make_job_def_name(image_name: str, job_def_suffix: str = "-jd") -> str:
     """
     Autogenerate a job definition name from an image name.
+
+    Every submission of a workflow typically uses the same few images, so the
+    names are cached rather than re-derived for each submitted job.
     """
     # Trim registry and tag from image_name.
     if "amazonaws.com" in image_name:
@@ -342,7 +350,8 @@ def get_batch_job_name(prefix: str, job_hash: str, array: bool = False) -> str:
     """
     Return a AWS Batch Job name by either job or job hash.
     """
-    return "{}-{}{}".format(prefix, job_hash, f"-{ARRAY_JOB_SUFFIX}" if array else "")
+    suffix = f"-{ARRAY_JOB_SUFFIX}" if array else ""
+    return f"{prefix}-{job_hash}{suffix}"
 
 
 def get_hash_from_job_name(job_name: str) -> Optional[str]:
@@ -364,7 +373,14 @@ def get_hash_from_job_name(job_name: str) -> Optional[str]:
     # where a headnode job is running but has no hash so we don't want to interact with that job
     # here. If we don't find a match, consider this a case of the above where we matched unrelated
     # jobs and return None to let callers know this is the case.
-    match = re.match(".*-(?P<hash>[^-]+)", job_name)
+    #
+    # Fast path: the hash is the last dash-delimited component of the job name.
+    _, sep, job_hash = job_name.rpartition("-")
+    if sep and job_hash:
+        return job_hash
+
+    # Fallback for names with trailing dashes.
+    match = JOB_NAME_HASH_PATTERN.match(job_name)
     if match:
         return match["hash"]
 
@@ -444,7 +460,7 @@ def submit_task(
         # Array jobs set this up earlier, in `_submit_array_job`
         input_file = File(input_path)
         with input_file.open("wb") as out:
-            pickle_dump([args, kwargs], out)
+            pickle_dump([args, kwargs], out, protocol=PICKLE_TRANSPORT_PROTOCOL)
 
     # Determine additional python import paths.
     import_args = []
@@ -483,7 +499,9 @@ def submit_task(
 
         # Submit to AWS Batch.
         job_name = get_batch_job_name(
-            job_options.get("job_name_prefix", "batch-job"), job_hash, array=bool(array_size)
+            job_options.get("job_name_prefix", DEFAULT_JOB_NAME_PREFIX),
+            job_hash,
+            array=bool(array_size),
         )
 
         result = batch_submit(
@@ -576,7 +594,7 @@ chmod +x .task_command
         # Submit to AWS Batch.
         assert job.eval_hash
         job_name = get_batch_job_name(
-            job_options.get("job_name_prefix", "batch-job"), job.eval_hash
+            job_options.get("job_name_prefix", DEFAULT_JOB_NAME_PREFIX), job.eval_hash
         )
 
         # Submit to AWS Batch.
@@ -611,7 +629,8 @@ def parse_task_error(
     if not job.task.script:
         # Normal Tasks (non-script) store errors as Pickled exception, traceback tuples.
         if error_file.exists():
-            error, error_traceback = pickle.loads(cast(bytes, error_file.read("rb")))
+            with error_file.open("rb") as infile:
+                error, error_traceback = pickle.load(infile)
         else:
             if batch_job_metadata:
                 try:
@@ -648,8 +667,14 @@ def parse_task_logs(
     """
     Iterates through most recent CloudWatch logs of an AWS Batch Job.
     """
+    # Only request as many log events as we will display (plus one to detect
+    # truncation), so that we avoid downloading large logs in full.
     lines_iter = iter_batch_job_log_lines(
-        batch_job_id, reverse=True, required=required, aws_region=aws_region
+        batch_job_id,
+        limit=max_lines + 1,
+        reverse=True,
+        required=required,
+        aws_region=aws_region,
     )
     lines = reversed(list(islice(lines_iter, 0, max_lines)))
 
@@ -659,12 +684,13 @@ def parse_task_logs(
 
 
 def aws_describe_jobs(
-    job_ids: List[str], chunk_size: int = 100, aws_region: str = aws_utils.DEFAULT_AWS_REGION
+    job_ids: List[str],
+    chunk_size: int = MAX_DESCRIBE_JOBS,
+    aws_region: str = aws_utils.DEFAULT_AWS_REGION,
 ) -> Iterator[dict]:
     """
     Returns AWS Batch Job descriptions from the AWS API.
     """
-    # The AWS Batch API can only query up to 100 jobs at a time.
     batch_client = aws_utils.get_aws_client("batch", aws_region=aws_region)
     for i in range(0, len(job_ids), chunk_size):
         chunk_job_ids = job_ids[i : i + chunk_size]
@@ -801,6 +827,7 @@ def iter_batch_job_log_lines(
     job_id: str,
     aws_region: str = aws_utils.DEFAULT_AWS_REGION,
     log_group_name: str = BATCH_LOG_GROUP,
+    limit: Optional[int] = None,
     reverse: bool = False,
     required: bool = True,
 ) -> Iterator[str]:
@@ -809,6 +836,7 @@ def iter_batch_job_log_lines(
     """
     events = iter_batch_job_logs(
         job_id,
+        limit=limit,
         reverse=reverse,
         log_group_name=log_group_name,
         required=required,
@@ -877,10 +905,11 @@ class AWSBatchExecutor(Executor):
         self.s3_scratch_prefix = config["s3_scratch"]
 
         # Optional config.
-        self.aws_region = config.get("aws_region", aws_utils.get_default_region())
+        self.aws_region = config.get("aws_region") or aws_utils.get_default_region()
         self.role = config.get("role")
         self.code_package = aws_utils.parse_code_package_config(config)
         self.code_file: Optional[File] = None
+        self._code_package_lock = threading.Lock()
         self.debug = config.getboolean("debug", fallback=False)
 
         # Default task options.
@@ -897,14 +926,20 @@ class AWSBatchExecutor(Executor):
         self.use_default_batch_tags = config.getboolean("default_batch_tags", True)
 
         self.is_running = False
+        self._exit_flag = threading.Event()
         # We use an OrderedDict in order to retain submission order.
         self.pending_batch_jobs: Dict[str, "Job"] = OrderedDict()
         self.preexisting_batch_jobs: Dict[str, str] = {}  # Job hash -> Job ID
+        # Job ID -> (timestamp, Job description)
+        self._preexisting_job_descriptions: Dict[str, Tuple[float, dict]] = {}
+        # Guards the preexisting jobs and descriptions against concurrent submissions.
+        self._preexisting_lock = threading.Lock()
 
         if not self.debug:
             self.interval = config.getfloat("job_monitor_interval", 5.0)
         else:
             self.interval = config.getfloat("job_monitor_interval", 0.2)
+        self._preexisting_job_ttl = self.interval * 10
 
         self.arrayer = JobArrayer(
             executor=self,
@@ -971,17 +1006,25 @@ class AWSBatchExecutor(Executor):
             self._aws_user = aws_utils.get_aws_user()
 
             self.is_running = True
-            self._thread = threading.Thread(target=self._monitor, daemon=False)
+            # Each monitor thread gets its own exit flag, so that a previous monitor
+            # finishing its shutdown cannot wake up a newly started one.
+            self._exit_flag = threading.Event()
+            self._thread = threading.Thread(
+                target=self._monitor, args=(self._exit_flag,), daemon=False
+            )
             self._thread.start()
 
     def stop(self) -> None:
         """
         Stop Executor and monitoring thread.
         """
+        exit_flag = self._exit_flag
         self.arrayer.stop()
         self.is_running = False
+        # Wake up the monitor thread, if it is waiting between polls.
+        exit_flag.set()
 
-    def _monitor(self) -> None:
+    def _monitor(self, exit_flag: threading.Event) -> None:
         """
         Thread for monitoring running AWS Batch jobs.
 
@@ -995,7 +1038,7 @@ class AWSBatchExecutor(Executor):
           of API calls. 100 job ids is the maximum supported amount by
           `describe_jobs()`.
         - We do only one describe_jobs() API call per monitor loop, and then
-          sleep `self.interval` seconds.
+          wait `self.interval` seconds (or until the executor is stopped).
         - AWS Batch runs jobs in approximately the order submitted. So if we
           monitor job statuses in submission order, a run of PENDING statuses
           (`pending_truncate`) suggests the rest of the jobs will be PENDING.
@@ -1008,7 +1051,6 @@ class AWSBatchExecutor(Executor):
         thread low so as to not interfere with new submissions.
         """
         assert self.scheduler
-        chunk_size = 100
         pending_truncate = 10
 
         try:
@@ -1032,9 +1074,9 @@ class AWSBatchExecutor(Executor):
                     )
                     for i, job in enumerate(jobs):
                         self._process_job_status(job)
-                        if i % chunk_size == 0:
-                            # Sleep after every chunk to avoid excessive API calls.
-                            time.sleep(self.interval)
+                        if i % MAX_DESCRIBE_JOBS == 0:
+                            # Wait after every chunk to avoid excessive API calls.
+                            exit_flag.wait(self.interval)
 
                 else:
                     # Copy pending_batch_jobs since it can change due to new submissions.
@@ -1043,7 +1085,7 @@ class AWSBatchExecutor(Executor):
                     )
                     for job in jobs:
                         self._process_job_status(job)
-                time.sleep(self.interval)
+                exit_flag.wait(self.interval)
 
         except Exception as error:
             # Since we run this is method at the top-level of a thread, we
@@ -1213,15 +1255,14 @@ class AWSBatchExecutor(Executor):
         """
         assert self.scheduler
 
-        output_file = File(
-            aws_utils.get_job_scratch_file(
-                self.s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-            )
-        )
-        if output_file.exists():
+        # Read the output directly instead of checking for existence first, so
+        # that each completed job costs one S3 request instead of two.
+        try:
             result = aws_utils.parse_task_result(self.s3_scratch_prefix, job)
-            if not check_valid or self.scheduler.is_valid_value(result):
-                return result, True
+        except FileNotFoundError:
+            return None, False
+        if not check_valid or self.scheduler.is_valid_value(result):
+            return result, True
         return None, False
 
     def _submit(self, job: Job, args: Tuple, kwargs: dict) -> None:
@@ -1245,26 +1286,30 @@ class AWSBatchExecutor(Executor):
         # then we can skip this step. Additionally, if we have already packaged and set code_file,
         # then we do not need to repackage.
         if self.code_package is not False and self.code_file is None:
-            code_package = self.code_package or {}
-            assert isinstance(code_package, dict)
-            self.code_file = aws_utils.package_code(self.s3_scratch_prefix, code_package)
+            with self._code_package_lock:
+                # Concurrent submissions may race to package the code, so check again
+                # under the lock to ensure we only package and upload the code once.
+                if self.code_file is None:
+                    code_package = self.code_package or {}
+                    assert isinstance(code_package, dict)
+                    self.code_file = aws_utils.package_code(self.s3_scratch_prefix, code_package)
 
         job_dir = aws_utils.get_job_scratch_dir(self.s3_scratch_prefix, job)
         job_type = "AWS Batch job" if not self.debug else "Docker container"
 
-        # Determine job options.
-        task_options = self._get_job_options(job)
-        use_cache = task_options.get("cache", True)
+        # Determine whether caching is enabled. Only this one option is needed here, so avoid
+        # building the full job options (including batch tags) until the job is submitted.
+        use_cache = job.get_option("cache", self.default_task_options.get("cache", True))
 
         # Determine if we can reunite with a previous Batch output or job.
         batch_job_id: Optional[str] = None
-        if use_cache and job.eval_hash in self.preexisting_batch_jobs:
-            batch_job_id = self.preexisting_batch_jobs.pop(job.eval_hash)
+        if use_cache and job.eval_hash:
+            with self._preexisting_lock:
+                batch_job_id = self.preexisting_batch_jobs.pop(job.eval_hash, None)
 
+        if batch_job_id:
             # Make sure Batch API still has a status on this job.
-            existing_job = next(
-                aws_describe_jobs([batch_job_id], aws_region=self.aws_region), None
-            )
+            existing_job = self._describe_preexisting_job(batch_job_id)
 
             # Reunite with inflight batch job, if present.
             if existing_job:
@@ -1290,6 +1335,48 @@ class AWSBatchExecutor(Executor):
 
         self._start()
 
+    def _describe_preexisting_job(self, batch_job_id: str) -> Optional[dict]:
+        """
+        Returns the AWS Batch description of a preexisting job, if it still exists.
+
+        When reuniting with many inflight jobs, describing them one at a time
+        would use one API call per job. Instead, we describe the job together
+        with a chunk of other preexisting jobs that are likely to be reunited
+        soon, and cache those descriptions for a short time.
+        """
+        now = time.time()
+        # Concurrent submissions may reunite jobs at the same time, so access the
+        # preexisting jobs and their cached descriptions under the lock.
+        with self._preexisting_lock:
+            cached = self._preexisting_job_descriptions.pop(batch_job_id, None)
+            if cached:
+                timestamp, job = cached
+                if now - timestamp < self._preexisting_job_ttl:
+                    return job
+
+            job_ids = [batch_job_id] + list(
+                islice(
+                    (
+                        job_id
+                        for job_id in self.preexisting_batch_jobs.values()
+                        if job_id not in self._preexisting_job_descriptions
+                    ),
+                    MAX_DESCRIBE_JOBS - 1,
+                )
+            )
+
+        existing_job: Optional[dict] = None
+        descriptions: Dict[str, Tuple[float, dict]] = {}
+        for job in aws_describe_jobs(job_ids, aws_region=self.aws_region):
+            if job["jobId"] == batch_job_id:
+                existing_job = job
+            else:
+                descriptions[job["jobId"]] = (now, job)
+
+        with self._preexisting_lock:
+            self._preexisting_job_descriptions.update(descriptions)
+        return existing_job
+
     def _submit_array_job(
         self, jobs: List[Job], all_args: List[Tuple], all_kwargs: List[Dict]
     ) -> str:
@@ -1317,7 +1404,7 @@ class AWSBatchExecutor(Executor):
             self.s3_scratch_prefix, array_uuid, aws_utils.S3_SCRATCH_INPUT
         )
         with File(input_file).open("wb") as out:
-            pickle_dump([all_args, all_kwargs], out)
+            pickle_dump([all_args, all_kwargs], out, protocol=PICKLE_TRANSPORT_PROTOCOL)
 
         # Output file is a plaintext list of output paths, for each child job.
         output_file = aws_utils.get_array_scratch_file(
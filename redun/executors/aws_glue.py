@@ -14,7 +14,7 @@ from redun.file import File
 from redun.hashing import hash_stream, hash_text
 from redun.scheduler import Job, Scheduler, Traceback
 from redun.task import Task
-from redun.utils import pickle_dump
+from redun.utils import PICKLE_TRANSPORT_PROTOCOL, pickle_dump
 
 ARGS = ["code", "script", "task", "input", "output", "error"]
 VALID_GLUE_WORKERS = ["Standard", "G.1X", "G.2X"]
@@ -167,7 +167,7 @@ class AWSGlueExecutor(Executor):
         self.s3_scratch_prefix = config["s3_scratch"]
 
         # Optional config
-        self.aws_region = config.get("aws_region", aws_utils.get_default_region())
+        self.aws_region = config.get("aws_region") or aws_utils.get_default_region()
         self.role = config.get("role") or get_default_glue_service_role(aws_region=self.aws_region)
         self.code_package = aws_utils.parse_code_package_config(config)
         self.code_file: Optional[File] = None
@@ -332,15 +332,14 @@ class AWSGlueExecutor(Executor):
         """
         assert self.scheduler
 
-        output_file = File(
-            aws_utils.get_job_scratch_file(
-                self.s3_scratch_prefix, job, aws_utils.S3_SCRATCH_OUTPUT
-            )
-        )
-        if output_file.exists():
+        # Read the output directly instead of checking for existence first, so
+        # that each completed job costs one S3 request instead of two.
+        try:
             result = aws_utils.parse_task_result(self.s3_scratch_prefix, job)
-            if not check_valid or self.scheduler.is_valid_value(result):
-                return result, True
+        except FileNotFoundError:
+            return None, False
+        if not check_valid or self.scheduler.is_valid_value(result):
+            return result, True
         return None, False
 
     def _process_job_status(self, job: dict) -> None:
@@ -470,7 +469,7 @@ class AWSGlueExecutor(Executor):
             )
             input_file = File(input_path)
             with input_file.open("wb") as out:
-                pickle_dump([args, kwargs], out)
+                pickle_dump([args, kwargs], out, protocol=PICKLE_TRANSPORT_PROTOCOL)
 
             self.pending_glue_jobs.append((job, args, kwargs))
 
@@ -621,7 +620,8 @@ def parse_task_error(
 
     if error_file.exists():
         try:
-            error, error_traceback = pickle.loads(cast(bytes, error_file.read("rb")))
+            with error_file.open("rb") as infile:
+                error, error_traceback = pickle.load(infile)
         except Exception as parse_error:
             error = AWSGlueError(f"Error could not be parsed. See logs. {parse_error}")
             error_traceback = Traceback.from_error(error)
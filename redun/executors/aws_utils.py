@@ -1,4 +1,5 @@
 import glob
+import gzip
 import os
 import pickle
 import shlex
@@ -9,6 +10,8 @@ import zipfile
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
 
 import boto3
+import botocore.session
+from botocore.config import Config
 
 from redun.file import File
 from redun.hashing import hash_stream
@@ -18,6 +21,10 @@ from redun.scheduler import Job
 REDUN_PROG = "redun"
 REDUN_REQUIRED_VERSION = ">=0.4.1"
 DEFAULT_AWS_REGION = "us-west-2"
+TAR_BUFFER_SIZE = 1024 * 1024
+
+# Default AWS client retry settings, unless the user configures retries.
+DEFAULT_AWS_RETRY_CONFIG = {"total_max_attempts": 5, "mode": "standard"}
 
 # S3 scratch filenames.
 S3_SCRATCH_INPUT = "input"
@@ -28,7 +35,7 @@ S3_SCRATCH_HASHES = "eval_hashes"
 S3_SCRATCH_STATUS = "status"
 
 # Cache for AWS Clients.
-_boto_clients: Dict[Tuple[int, str, str], boto3.Session] = {}
+_boto_clients: Dict[Tuple[int, str, Optional[str]], boto3.Session] = {}
 
 
 class JobStatus(NamedTuple):
@@ -41,18 +48,41 @@ class JobStatus(NamedTuple):
     timeout: List[str]
 
 
-def get_aws_client(service: str, aws_region: str = DEFAULT_AWS_REGION) -> boto3.Session:
+def get_aws_client(service: str, aws_region: Optional[str] = DEFAULT_AWS_REGION) -> boto3.Session:
     """
     Get an AWS Client with caching.
+
+    If `aws_region` is None, the client uses the default region of the boto3
+    configuration.
+
+    Unless retries are configured through the AWS environment variables or
+    config file, clients use standard-mode retries, which back off on
+    throttling and transient server errors.
     """
     cache_key = (threading.get_ident(), service, aws_region)
     client = _boto_clients.get(cache_key)
     if not client:
-        client = _boto_clients[cache_key] = boto3.client(service, region_name=aws_region)
+        config = None if has_aws_retry_config() else Config(retries=dict(DEFAULT_AWS_RETRY_CONFIG))
+        client = _boto_clients[cache_key] = boto3.client(
+            service, region_name=aws_region, config=config
+        )
 
     return client
 
 
+def has_aws_retry_config() -> bool:
+    """
+    Returns True if the user has configured AWS client retries.
+
+    A client Config takes precedence over these settings, so we only supply
+    our own retry config when they are absent.
+    """
+    if "AWS_RETRY_MODE" in os.environ or "AWS_MAX_ATTEMPTS" in os.environ:
+        return True
+    scoped_config = botocore.session.get_session().get_scoped_config()
+    return "retry_mode" in scoped_config or "max_attempts" in scoped_config
+
+
 def find_code_files(
     basedir: str = ".", includes: Optional[List[str]] = None, excludes: Optional[List[str]] = None
 ) -> Iterable[str]:
@@ -73,16 +103,38 @@ def find_code_files(
     return files
 
 
+def _normalize_tar_info(tar_info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """
+    Clear file metadata that varies between checkouts from a tar member.
+    """
+    tar_info.mtime = 0
+    tar_info.uid = tar_info.gid = 0
+    tar_info.uname = tar_info.gname = ""
+    return tar_info
+
+
 def create_tar(tar_path: str, file_paths: Iterable[str]) -> File:
     """
     Create a tar file from local file paths.
+
+    Files are added in sorted order, their mtimes and owners are cleared, and
+    the gzip header omits the timestamp and filename, so that packaging the
+    same code twice produces the same tar file. This allows `package_code()`
+    to reuse an existing code package on S3 instead of uploading a new one on
+    every run.
+
+    Code packages are mostly small text files, so fast gzip compression is
+    used. Higher levels cost CPU without meaningfully shrinking the upload.
     """
     tar_file = File(tar_path)
 
     with tar_file.open("wb") as out:
-        with tarfile.open(fileobj=out, mode="w|gz") as tar:
-            for file_path in file_paths:
-                tar.add(file_path)
+        with gzip.GzipFile(
+            filename="", fileobj=out, mode="wb", compresslevel=1, mtime=0
+        ) as gzip_out:
+            with tarfile.open(fileobj=gzip_out, mode="w|", bufsize=TAR_BUFFER_SIZE) as tar:
+                for file_path in sorted(file_paths):
+                    tar.add(file_path, filter=_normalize_tar_info)
 
     return tar_file
 
@@ -164,13 +164,21 @@ class JobArrayer:
         self.start()
 
     def get_stale_descrs(self):
-        """Submits jobs that haven't been touched in a while"""
+        """
+        Submits jobs that haven't been touched in a while.
+
+        Groups that already have enough jobs to fill an array job are
+        submitted right away, since waiting for them to go stale would not
+        allow any further coalescing.
+        """
         currtime = time.time()
-        stales = [
-            descr
-            for descr in self.pending
-            if (currtime - self.pending_timestamps[descr] > self.stale_time)
-        ]
+        with self._lock:
+            stales = [
+                descr
+                for descr, jobs in self.pending.items()
+                if len(jobs) >= self.max_array_size
+                or currtime - self.pending_timestamps[descr] > self.stale_time
+            ]
         return stales
 
     def submit_pending_jobs(self, descr: JobDescription):
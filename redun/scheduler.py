@@ -272,6 +272,48 @@ class Job:
     def __repr__(self) -> str:
         return f"Job(id={self.id}, task_name={self.task_name})"
 
+    def __getstate__(self) -> dict:
+        # Only serialize the identifying parts of a Job. Execution state, such as
+        # the expression, promises, and links to parent, child, and execution,
+        # is specific to the Scheduler and would otherwise pull the entire job
+        # tree into the pickle (e.g. when pickling a Traceback's Frames).
+        return {
+            "id": self.id,
+            "task_name": self.task_name,
+            "task": self.task,
+            "task_options": self.task_options,
+            "args_hash": self.args_hash,
+            "eval_hash": self.eval_hash,
+            "call_hash": self.call_hash,
+            "was_cached": self.was_cached,
+            "status": self.status,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.id = state["id"]
+        self.task_name = state["task_name"]
+        self.task = state["task"]
+        self.task_options = state["task_options"]
+        self.args_hash = state["args_hash"]
+        self.eval_hash = state["eval_hash"]
+        self.call_hash = state["call_hash"]
+        self.was_cached = state["was_cached"]
+        self._status = state["status"]
+
+        # Execution state is not restored.
+        self.expr = None  # type: ignore
+        self.args = None  # type: ignore
+        self.kwargs = None  # type: ignore
+        self.execution = None
+        self.eval_args = None
+        self.result_promise = None  # type: ignore
+        self.result = None
+        self.child_jobs = []
+        self.parent_job = None
+        self.handle_forks = defaultdict(int)
+        self.job_tags = []
+        self.value_tags = []
+
     @property
     def status(self) -> str:
         if self._status:
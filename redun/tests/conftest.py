@@ -6,6 +6,7 @@ from typing import Iterator, Optional, Tuple, cast
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
+from moto import mock_s3
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import OperationalError
@@ -15,6 +16,7 @@ from redun import Scheduler
 from redun.backends.db import RedunBackendDb
 from redun.config import Config
 from redun.task import get_task_registry
+from redun.tests.utils import get_mock_s3_client
 from redun.utils import clear_import_paths
 
 logger = logging.getLogger(__name__)
@@ -158,6 +160,17 @@ def session(backend: RedunBackendDb) -> Session:
     return backend.session
 
 
+@pytest.fixture
+def s3_bucket() -> Iterator[str]:
+    """
+    Mock S3 for a test and create the `example-bucket` bucket.
+    """
+    bucket = "example-bucket"
+    with mock_s3():
+        get_mock_s3_client().create_bucket(Bucket=bucket)
+        yield bucket
+
+
 @pytest.fixture(autouse=True)
 def redun_globals():
     """
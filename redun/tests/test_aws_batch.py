@@ -1,6 +1,8 @@
 import json
 import os
 import pickle
+import threading
+import time
 import uuid
 from typing import cast
 from unittest.mock import Mock, patch
@@ -11,6 +13,7 @@ from freezegun import freeze_time
 from moto import mock_logs, mock_s3
 
 import redun.executors.aws_batch
+import redun.executors.aws_utils
 from redun import File, job_array, task
 from redun.cli import RedunClient, import_script
 from redun.config import Config
@@ -29,6 +32,7 @@ from redun.executors.aws_batch import (
     iter_batch_job_logs,
     make_job_def_name,
     parse_task_error,
+    parse_task_logs,
     submit_task,
 )
 from redun.executors.aws_utils import (
@@ -37,6 +41,7 @@ from redun.executors.aws_utils import (
     extract_tar,
     find_code_files,
     get_array_scratch_file,
+    get_aws_client,
     get_job_scratch_file,
     package_code,
     parse_code_package_config,
@@ -44,7 +49,7 @@ from redun.executors.aws_utils import (
 from redun.file import Dir
 from redun.scheduler import Execution, Job, Scheduler, Traceback
 from redun.scripting import ScriptError
-from redun.tests.utils import mock_scheduler, use_tempdir, wait_until
+from redun.tests.utils import get_mock_s3_client, mock_scheduler, use_tempdir, wait_until
 from redun.utils import pickle_dumps
 
 
@@ -58,6 +63,25 @@ def test_make_job_def_name() -> None:
     assert make_job_def_name("a" * 200) == ("a" * 125) + "-jd"
 
 
+def test_get_aws_client() -> None:
+    """
+    AWS clients should be cached per thread and default to standard-mode retries.
+    """
+    cache_key = (threading.get_ident(), "batch", "us-east-1")
+    try:
+        client = get_aws_client("batch", aws_region="us-east-1")
+        assert get_aws_client("batch", aws_region="us-east-1") is client
+        assert client.meta.config.retries == {"mode": "standard", "total_max_attempts": 5}
+
+        # Retry settings configured by the user should take precedence.
+        redun.executors.aws_utils._boto_clients.pop(cache_key)
+        with patch.dict(os.environ, {"AWS_RETRY_MODE": "adaptive", "AWS_MAX_ATTEMPTS": "10"}):
+            client = get_aws_client("batch", aws_region="us-east-1")
+        assert client.meta.config.retries == {"mode": "adaptive", "total_max_attempts": 10}
+    finally:
+        redun.executors.aws_utils._boto_clients.pop(cache_key, None)
+
+
 @patch("redun.executors.aws_utils.get_aws_client")
 def test_get_job_definition(get_aws_client_mock) -> None:
     """
@@ -115,6 +139,23 @@ def test_get_hash_from_job_name(array, suffix) -> None:
     assert job_hash2 == job_hash
 
 
+@pytest.mark.parametrize(
+    "job_name,job_hash",
+    [
+        ("headnode", None),
+        ("prefix-hash", "hash"),
+        ("prefix-hash--", "hash"),
+        ("prefix-hash-array", "hash"),
+        ("-", None),
+    ],
+)
+def test_get_hash_from_job_name_edge_cases(job_name, job_hash) -> None:
+    """
+    Unrelated job names without a hash should return None.
+    """
+    assert get_hash_from_job_name(job_name) == job_hash
+
+
 def test_batch_tags(scheduler: Scheduler) -> None:
     """
     Executor should be able to determine batch tags for a batch job.
@@ -223,7 +264,6 @@ def task1_custom_module(x):
 
 
 @use_tempdir
-@mock_s3
 @patch("redun.executors.aws_batch.batch_submit")
 @pytest.mark.parametrize(
     "custom_module, expected_load_module, a_task",
@@ -232,15 +272,12 @@ def task1_custom_module(x):
         ("custom.module", "custom.module", task1_custom_module),
     ],
 )
-def test_submit_task(batch_submit_mock, custom_module, expected_load_module, a_task):
+def test_submit_task(batch_submit_mock, s3_bucket, custom_module, expected_load_module, a_task):
     job_id = "123"
     image = "my-image"
     queue = "queue"
     s3_scratch_prefix = "s3://example-bucket/redun/"
 
-    client = boto3.client("s3", region_name="us-east-1")
-    client.create_bucket(Bucket="example-bucket")
-
     redun.executors.aws_batch.batch_submit.return_value = {"jobId": "batch-job-id"}
 
     # Create example workflow script to be packaged.
@@ -270,8 +307,12 @@ def task1(x):
     # We should get a AWS Batch job id back.
     assert resp["jobId"] == "batch-job-id"
 
-    # Input files should be made.
-    assert File("s3://example-bucket/redun/jobs/eval_hash/input").exists()
+    # Input files should be made and only contain the task arguments.
+    input_file = File("s3://example-bucket/redun/jobs/eval_hash/input")
+    assert input_file.exists()
+    input_data = cast(bytes, input_file.read("rb"))
+    assert pickle.loads(input_data) == [[10], {}]
+    assert len(input_data) < 100
     [code_file] = list(Dir("s3://example-bucket/redun/code"))
 
     # We should have submitted a job to AWS Batch.
@@ -302,9 +343,8 @@ def task1(x):
 
 
 @use_tempdir
-@mock_s3
 @patch("redun.executors.aws_batch.batch_submit")
-def test_submit_task_deep_file(batch_submit_mock):
+def test_submit_task_deep_file(batch_submit_mock, s3_bucket):
     """
     Executor should be able to submit a task defined in a deeply nested file path.
     """
@@ -313,9 +353,6 @@ def test_submit_task_deep_file(batch_submit_mock):
     queue = "queue"
     s3_scratch_prefix = "s3://example-bucket/redun/"
 
-    client = boto3.client("s3", region_name="us-east-1")
-    client.create_bucket(Bucket="example-bucket")
-
     redun.executors.aws_batch.batch_submit.return_value = {"jobId": "batch-job-id"}
 
     # Create example workflow script to be packaged.
@@ -382,16 +419,12 @@ def task1(x):
     )
 
 
-@mock_s3
-def test_parse_task_error() -> None:
+def test_parse_task_error(s3_bucket) -> None:
     """
     We should be able to parse the error of a failed task.
     """
     s3_scratch_prefix = "s3://example-bucket/redun/"
 
-    client = boto3.client("s3", region_name="us-east-1")
-    client.create_bucket(Bucket="example-bucket")
-
     @task()
     def task1(x):
         return x + 1
@@ -520,6 +553,19 @@ def test_iter_batch_job_logs(aws_describe_jobs_mock) -> None:
         "2020-10-13 06:47:14  A message 4.",
     ]
 
+    # Fetch the most recent log lines, only requesting as many events as needed.
+    with patch(
+        "redun.executors.aws_batch.iter_batch_job_log_lines", wraps=iter_batch_job_log_lines
+    ) as iter_batch_job_log_lines_mock:
+        lines = list(parse_task_logs(job_id, max_lines=2))
+    assert lines == [
+        "\n*** Earlier logs are truncated ***\n",
+        "2020-10-13 06:47:13  A message 3.",
+        "2020-10-13 06:47:14  A message 4.",
+    ]
+    assert iter_batch_job_log_lines_mock.call_args[1]["limit"] == 3
+    assert iter_batch_job_log_lines_mock.call_args[1]["reverse"] is True
+
     # Fetch logs from unknown job.
     aws_describe_jobs_mock.side_effect = lambda *args, **kwargs: iter([])
     assert list(iter_batch_job_logs("unknown_job_id")) == []
@@ -574,12 +620,33 @@ def mock_executor(scheduler, debug=False, code_package=False):
     executor.get_array_child_jobs = Mock()
     executor.get_array_child_jobs.return_value = []
 
-    s3_client = boto3.client("s3", region_name="us-east-1")
-    s3_client.create_bucket(Bucket="example-bucket")
+    get_mock_s3_client().create_bucket(Bucket="example-bucket")
 
     return executor
 
 
+@mock_s3
+def test_get_job_output() -> None:
+    """
+    Executor should read job output only if it exists.
+    """
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+
+    job = Job(task1(10))
+    job.task = task1
+    job.eval_hash = "eval_hash"
+
+    assert executor._get_job_output(job) == (None, False)
+
+    File(
+        get_job_scratch_file(
+            executor.s3_scratch_prefix, job, redun.executors.aws_utils.S3_SCRATCH_OUTPUT
+        )
+    ).write(pickle_dumps(20), mode="wb")
+    assert executor._get_job_output(job) == (20, True)
+
+
 @mock_s3
 @patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
 @patch("redun.executors.aws_batch.parse_task_logs")
@@ -1072,6 +1139,128 @@ def test_code_packaging(package_code_mock, get_aws_user_mock) -> None:
     executor.stop()
 
 
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_utils.package_code")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_code_packaging_concurrent(
+    batch_submit_mock, iter_batch_job_status_mock, package_code_mock, get_aws_user_mock
+) -> None:
+    """
+    Ensure that concurrent submissions only package code once.
+    """
+
+    def slow_package_code(*args, **kwargs):
+        time.sleep(0.1)
+        return "s3://fake-bucket/code.tar.gz"
+
+    package_code_mock.side_effect = slow_package_code
+    batch_submit_mock.return_value = {"jobId": "batch-job-id"}
+    iter_batch_job_status_mock.return_value = iter([])
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler, code_package=True)
+    executor.start()
+
+    # Hand create jobs.
+    jobs = []
+    for i in range(4):
+        job = Job(task1(i))
+        job.id = str(i)
+        job.task = task1
+        job.eval_hash = f"eval_hash{i}"
+        jobs.append(job)
+
+    threads = [
+        threading.Thread(target=executor.submit, args=(job, [i], {})) for i, job in enumerate(jobs)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert executor.code_file == "s3://fake-bucket/code.tar.gz"
+    assert package_code_mock.call_count == 1
+
+    executor.stop()
+
+
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_stop_wakes_monitor(
+    batch_submit_mock, iter_batch_job_status_mock, get_aws_user_mock
+) -> None:
+    """
+    Stopping the executor should not wait for the monitor polling interval.
+    """
+    batch_submit_mock.return_value = {"jobId": "batch-job-id"}
+    iter_batch_job_status_mock.return_value = iter([])
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.interval = 1000
+    executor.start()
+
+    job = Job(task1(10))
+    job.task = task1
+    job.eval_hash = "eval_hash"
+    executor.submit(job, [10], {})
+    wait_until(lambda: executor.pending_batch_jobs)
+
+    executor.stop()
+    executor._thread.join(timeout=5)
+    assert not executor._thread.is_alive()
+
+
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_monitor_restart(
+    batch_submit_mock, iter_batch_job_status_mock, get_aws_user_mock
+) -> None:
+    """
+    A drained monitor finishing its shutdown should not wake up a restarted monitor.
+    """
+    batch_submit_mock.return_value = {"jobId": "batch-job-id"}
+    iter_batch_job_status_mock.side_effect = lambda *args, **kwargs: iter([])
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.interval = 1000
+
+    # With no pending jobs, the monitor drains and stops right away.
+    executor._start()
+    thread1 = executor._thread
+    thread1.join(timeout=5)
+    assert not thread1.is_alive()
+    assert not executor.is_running
+
+    # Simulate a submission restarting the monitor before the previous monitor
+    # has woken up its exit flag.
+    exit_flag1 = executor._exit_flag
+    job = Job(task1(10))
+    job.task = task1
+    job.eval_hash = "eval_hash"
+    executor.submit(job, [10], {})
+    wait_until(lambda: executor.pending_batch_jobs)
+    exit_flag1.set()
+
+    # The restarted monitor should keep waiting between polls.
+    thread2 = executor._thread
+    assert thread2 is not thread1
+    assert not executor._exit_flag.is_set()
+    time.sleep(0.1)
+    assert iter_batch_job_status_mock.call_count == 1
+
+    executor.stop()
+    thread2.join(timeout=5)
+    assert not thread2.is_alive()
+
+
 @mock_s3
 @patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
 def test_inflight_join_disabled_in_debug(get_aws_user_mock) -> None:
@@ -1194,6 +1383,85 @@ def test_executor_inflight_job(
     executor.stop()
 
 
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_batch.aws_describe_jobs")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_inflight_jobs_describe_once(
+    batch_submit_mock,
+    iter_batch_job_status_mock,
+    aws_describe_jobs_mock,
+    get_aws_user_mock,
+) -> None:
+    """
+    Reuniting with several inflight jobs should describe them in one API call.
+    """
+    iter_batch_job_status_mock.return_value = iter([])
+    aws_describe_jobs_mock.side_effect = lambda job_ids, **kwargs: iter(
+        [{"jobId": job_id} for job_id in job_ids]
+    )
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.get_jobs.return_value = [
+        {"jobId": "111", "jobName": "redun-job-eval_hash1"},
+        {"jobId": "222", "jobName": "redun-job-eval_hash2"},
+    ]
+    executor.start()
+
+    # Hand create jobs.
+    job1 = Job(task1(10))
+    job1.task = task1
+    job1.eval_hash = "eval_hash1"
+
+    job2 = Job(task1(20))
+    job2.task = task1
+    job2.eval_hash = "eval_hash2"
+
+    executor.submit(job1, [10], {})
+    executor.submit(job2, [20], {})
+
+    # Both jobs should be reunited without new submissions and with a single describe.
+    assert batch_submit_mock.call_count == 0
+    assert aws_describe_jobs_mock.call_count == 1
+    assert executor.pending_batch_jobs == {"111": job1, "222": job2}
+
+    executor.stop()
+
+
+@mock_s3
+@patch("redun.executors.aws_utils.get_aws_user", return_value="alice")
+@patch("redun.executors.aws_batch.aws_describe_jobs")
+@patch("redun.executors.aws_batch.iter_batch_job_status")
+@patch("redun.executors.aws_batch.batch_submit")
+def test_executor_inflight_job_no_cache(
+    batch_submit_mock,
+    iter_batch_job_status_mock,
+    aws_describe_jobs_mock,
+    get_aws_user_mock,
+) -> None:
+    """
+    Jobs with cache=False should not reunite with inflight jobs.
+    """
+    iter_batch_job_status_mock.return_value = iter([])
+
+    scheduler = mock_scheduler()
+    executor = mock_executor(scheduler)
+    executor.get_jobs.return_value = [{"jobId": "111", "jobName": "redun-job-eval_hash1"}]
+    executor.start()
+
+    job = Job(task1.options(cache=False)(10))
+    job.task = task1
+    job.eval_hash = "eval_hash1"
+    executor.submit(job, [10], {})
+
+    assert aws_describe_jobs_mock.call_count == 0
+    assert executor.preexisting_batch_jobs == {"eval_hash1": "111"}
+
+    executor.stop()
+
+
 @use_tempdir
 def test_find_code_files():
     # Creating python files.
@@ -1259,6 +1527,25 @@ def test_tar_code_files():
     }
 
 
+@use_tempdir
+def test_tar_code_files_reproducible() -> None:
+    """
+    Packaging the same code files twice should produce identical tar files.
+    """
+    File("workflow.py").write("")
+    File("lib/lib.py").write("")
+    File("lib/module/lib.py").write("")
+
+    file_paths = find_code_files()
+    tar_file1 = create_tar("code1.tar.gz", file_paths)
+
+    # File modification times, such as from a fresh checkout, should not matter.
+    os.utime("lib/lib.py", (1000, 1000))
+    tar_file2 = create_tar("code2.tar.gz", reversed(sorted(file_paths)))
+
+    assert tar_file1.read("rb") == tar_file2.read("rb")
+
+
 @use_tempdir
 def test_package_job_code() -> None:
     """
@@ -1381,6 +1668,28 @@ def test_job_staleness():
     wait_until(lambda: arr.get_stale_descrs() == [d])
 
 
+@mock_s3
+def test_job_staleness_full_array():
+    """Full job groupings should be submittable without waiting to go stale."""
+    j1 = Job(array_task(1))
+    j1.task = array_task
+    d = job_array.JobDescription(j1)
+
+    sched = mock_scheduler()
+    exec = mock_executor(sched)
+    arr = job_array.JobArrayer(
+        exec, submit_interval=10000.0, stale_time=10000.0, min_array_size=2, max_array_size=5
+    )
+
+    for i in range(4):
+        arr.add_job(j1, args=(i), kwargs={})
+    assert arr.get_stale_descrs() == []
+
+    arr.add_job(j1, args=(4), kwargs={})
+    assert arr.get_stale_descrs() == [d]
+    arr.stop()
+
+
 @mock_s3
 def test_arrayer_thread():
     """Tests that the arrayer monitor thread can be restarted after exit"""
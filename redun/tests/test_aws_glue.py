@@ -16,7 +16,7 @@ from redun.config import Config
 from redun.executors.aws_glue import AWSGlueExecutor, get_redun_lib_files, package_redun_lib
 from redun.executors.aws_utils import create_zip, get_aws_client
 from redun.scheduler import Job
-from redun.tests.utils import mock_scheduler, use_tempdir, wait_until
+from redun.tests.utils import get_mock_s3_client, mock_scheduler, use_tempdir, wait_until
 from redun.utils import pickle_dumps
 
 
@@ -165,8 +165,7 @@ def mock_executor(scheduler, debug=False, code_package=False):
             }
         }
     )
-    s3_client = boto3.client("s3", region_name="us-east-1")
-    s3_client.create_bucket(Bucket="example-bucket")
+    get_mock_s3_client().create_bucket(Bucket="example-bucket")
 
     with File("s3://example-bucket/redun.zip").open("w") as fh:
         fh.write("I am definitely a real file")
@@ -201,8 +200,7 @@ def test_executor_config(scheduler):
             }
         }
     )
-    s3_client = boto3.client("s3", region_name="us-east-1")
-    s3_client.create_bucket(Bucket="example-bucket")
+    get_mock_s3_client().create_bucket(Bucket="example-bucket")
 
     with File("s3://example-bucket/redun.zip").open("w") as fh:
         fh.write("I am definitely a real file")
@@ -248,13 +246,10 @@ def test_redun_lib_files() -> None:
     assert "redun/__init__.py" in namelist
 
 
-@moto.mock_s3
-def test_package_redun_lib() -> None:
+def test_package_redun_lib(s3_bucket) -> None:
     """
     We should be able to package the redun lib to S3.
     """
-    s3_client = boto3.client("s3", region_name="us-east-1")
-    s3_client.create_bucket(Bucket="example-bucket")
     s3_scratch_prefix = "s3://example-bucket/redun/"
 
     redun_file = package_redun_lib(s3_scratch_prefix)
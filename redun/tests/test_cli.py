@@ -1027,6 +1027,44 @@ def task_error(x: int):
     assert isinstance(error_traceback, Traceback)
 
 
+@use_tempdir
+def test_oneshot_unpicklable_error() -> None:
+    """
+    oneshot should record unpicklable errors as generic Exceptions.
+    """
+    File("workflow_error.py").write(
+        """
+from redun import task
+
+@task()
+def task_error(x: int):
+    raise ValueError(lambda: x)
+"""
+    )
+
+    client = RedunClient()
+    with pytest.raises(ValueError):
+        client.execute(
+            [
+                "redun",
+                "oneshot",
+                "--error",
+                "error",
+                "workflow_error.py",
+                "task_error",
+                "--x",
+                "10",
+            ]
+        )
+
+    error, error_traceback = pickle.loads(cast(bytes, File("error").read("rb")))
+
+    assert type(error) is Exception
+    assert str(error).startswith("ValueError(<function")
+    assert error_traceback.error is error
+    assert error_traceback.frames[-1].name == "task_error"
+
+
 @mock_logs
 @freeze_time("2020-01-01 00:00:00", tz_offset=-7)
 @patch("redun.executors.aws_batch.aws_describe_jobs")
@@ -1,4 +1,5 @@
 import os
+import pickle
 from traceback import FrameSummary
 from typing import Any, Dict, List, Sequence, Tuple
 from unittest.mock import Mock, patch
@@ -6,6 +7,7 @@ from unittest.mock import Mock, patch
 import pytest
 from sqlalchemy.orm import Session
 
+import redun.scheduler
 from redun import Scheduler, task
 from redun.backends.db import Execution, RedunBackendDb
 from redun.config import Config
@@ -14,6 +16,7 @@ from redun.promise import Promise
 from redun.scheduler import DryRunResult, Frame, Job, Task, Traceback, catch, cond, scheduler_task
 from redun.task import PartialTask, SchedulerTask
 from redun.tests.utils import assert_match_lines, use_tempdir
+from redun.utils import pickle_dumps
 from redun.value import Value, get_type_registry
 
 
@@ -661,6 +664,38 @@ def test_job_status() -> None:
     assert job.status == "FAILED"
 
 
+def test_job_pickle() -> None:
+    """
+    Pickling a Job should only include its identifying state, not the job tree.
+    """
+
+    @task()
+    def task1(x):
+        return x
+
+    execution = redun.scheduler.Execution("exec_id")
+    parent_job = Job(task1(list(range(1000))), execution=execution)
+    execution.add_job(parent_job)
+    job = Job(task1(list(range(1000))), parent_job=parent_job, execution=execution)
+    job.task = task1
+    job.eval_hash = "eval_hash"
+    job.eval_args = ((list(range(1000)),), {})
+
+    job2 = pickle.loads(pickle_dumps(job))
+    assert job2.id == job.id
+    assert job2.task_name == job.task_name
+    assert job2.task.fullname == "task1"
+    assert job2.eval_hash == "eval_hash"
+    assert job2.status == "RUNNING"
+    assert job2.parent_job is None
+    assert job2.execution is None
+    assert job2.expr is None
+
+    # Parent, execution, and arguments should not be serialized.
+    assert len(pickle_dumps(job)) < len(pickle_dumps(job.args))
+    assert len(pickle_dumps(parent_job)) < 1000
+
+
 def test_log_job_status(scheduler: Scheduler) -> None:
     """
     Scheduler should display a Job status table.
@@ -6,11 +6,12 @@ import shutil
 import tempfile
 import time
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import getmembers, getmodule, isclass, isfunction, ismethod, ismodule
 from itertools import zip_longest
 from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Type
 
+import boto3
 import sqlalchemy.event
 
 from redun import Scheduler
@@ -252,6 +253,20 @@ def docstring_owner_pretty_name(docstring_owner):
     return ".".join((docstring_owner.__module__, docstring_owner.__qualname__))
 
 
+@lru_cache(maxsize=None)
+def get_mock_s3_client() -> Any:
+    """
+    Returns a boto3 S3 client shared by all tests.
+
+    Creating a client under moto builds a new boto3 session each time, which
+    dominates the setup of many S3 tests. moto intercepts requests from any
+    client while a mock is active, so one client can be shared by all tests.
+    The client must first be requested while a moto mock is active, so that it
+    uses mock credentials.
+    """
+    return boto3.client("s3", region_name="us-east-1")
+
+
 def mock_scheduler():
     """
     Returns a scheduler with mocks for job completion.
@@ -35,6 +35,12 @@ T = TypeVar("T")
 NULL = object()
 PICKLE_PROTOCOL = 3
 
+# Protocol for transient pickles exchanged between the scheduler and remote
+# workers (e.g. job input, output, and error files). These pickles are never
+# hashed, so they are not bound to PICKLE_PROTOCOL. Protocol 4 adds framing and
+# support for large objects and is available on all supported python versions.
+PICKLE_TRANSPORT_PROTOCOL = 4
+
 # Additional python import paths added by user.
 _redun_import_paths: List[str] = []
 
@@ -95,13 +101,15 @@ def json_dumps(value: Any) -> str:
     return json.dumps(value, separators=(",", ":"), sort_keys=True)
 
 
-def pickle_dump(obj: Any, file: IO) -> None:
+def pickle_dump(obj: Any, file: IO, protocol: int = PICKLE_PROTOCOL) -> None:
     """
     Official pickling method for redun.
 
-    This is used to standardize the protocol used for serialization.
+    This is used to standardize the protocol used for serialization. Pickles
+    that are never hashed, such as executor scratch files, may instead use
+    `PICKLE_TRANSPORT_PROTOCOL`.
     """
-    return allowed_dump_func(obj, file, protocol=PICKLE_PROTOCOL)
+    return allowed_dump_func(obj, file, protocol=protocol)
 
 
 def pickle_dumps(obj: Any) -> bytes: